@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Benchmark: per-character loop (count_chars) vs translate engine
+# (count_text) on synthetic input of 1 MB, 100 MB, 1 GB...
+
+import sys
+import time
+
+from building import count_chars, count_text
+
+
+def make_block(size):
+    """Build `size` bytes of mostly-ASCII UTF-8 text (with some é/日)."""
+    line = "Python 3.0, released in 2008, was a major revision. Été 日本\n"
+    raw = line.encode("utf-8")
+    block = raw * (size // len(raw) + 1)
+    cut = size
+    while cut and 0x80 <= block[cut] < 0xC0:
+        cut -= 1  # never end the block inside a multibyte character
+    return block[:cut]
+
+
+def bench(func, block, repeat):
+    """Return seconds spent running func over `repeat` copies of block."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(block)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark for each size (in MB) given as argument."""
+    try:
+        sizes = [int(arg) for arg in sys.argv[1:]] or [1]
+    except ValueError:
+        print("AssertionError: the arguments are bad")
+        return
+
+    block = make_block(1 << 20)
+    text = block.decode("utf-8")
+    print(f"{'size':>8} | {'loop (s)':>10} | {'engine (s)':>10} | speedup")
+    for size in sizes:
+        # the input is streamed as 1 MB blocks so memory stays flat
+        loop = bench(count_chars, text, size)
+        engine = bench(count_text, block, size)
+        print(f"{size:>6}MB | {loop:>10.3f} | {engine:>10.3f} | "
+              f"x{loop / engine:.1f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# OUTPUT (sizes in MB, measured on one core)
+# $> python bench_building.py 1 100
+#     size |   loop (s) | engine (s) | speedup
+#      1MB |      0.117 |      0.015 | x7.9
+#    100MB |     11.180 |      1.203 | x9.3
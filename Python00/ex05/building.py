@@ -2,24 +2,17 @@
 
 # no code in global scope
 
+import mmap
+import multiprocessing
+import os
 import sys
+import time
+from collections import Counter
+from functools import lru_cache
 
 
-def main():
-    """Analyze the text provided as argument or user input."""
-
-    # check args nb
-    if len(sys.argv) > 2:
-        print("AssertionError: more than one argument is provided")
-        return
-
-    if len(sys.argv) == 2:
-        text = sys.argv[1]
-    else:
-        text = input("Give me the text to count?\n")
-        # print(text)
-
-    # init vars to count
+def count_chars(text):
+    """Return (upper, lower, punct, space, digit) counts for text."""
     upper = 0
     lower = 0
     punct = 0
@@ -38,8 +31,237 @@ def main():
             space += 1
         else:
             punct += 1
+    return upper, lower, punct, space, digit
+
+
+@lru_cache(maxsize=None)
+def _class_table():
+    """Build (once) a bytes.translate table: byte -> class code.
+
+    ASCII codes follow the count_chars order (0 upper, 1 lower,
+    2 punct, 3 space, 4 digit) and are derived from the str methods
+    themselves, so both paths always agree. Non-ASCII bytes map to 5.
+    """
+    table = bytearray(b"\5" * 256)
+    for i in range(128):
+        table[i] = count_chars(chr(i)).index(1)
+    return bytes(table)
+
+
+def count_text(data):
+    """Count classes of a str or of complete UTF-8 bytes.
+
+    The whole buffer is classified at C speed with bytes.translate +
+    bytes.count. Non-ASCII bytes are cut out with translate(delete=),
+    decoded, and only their distinct characters go through the
+    Unicode-aware count_chars loop (invalid UTF-8 counts as U+FFFD).
+    Returns (total, upper, lower, punct, space, digit).
+    """
+    errors = "replace"
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+        errors = "surrogatepass"
+
+    codes = data.translate(_class_table())
+    upper, lower, space, digit = (codes.count(c) for c in b"\0\1\3\4")
+    counts = [upper, lower, 0, space, digit]
+    wide = b"" if data.isascii() else data.translate(None, bytes(range(128)))
+    total = len(data) - len(wide)
+    counts[2] = total - sum(counts)  # every other ASCII byte is punct
+
+    if wide:
+        wide = wide.decode("utf-8", errors)
+        total += len(wide)
+        for char, nb in Counter(wide).items():
+            counts[count_chars(char).index(1)] += nb
+    return (total, *counts)
+
+
+def _utf8_cut(buf):
+    """Return the largest index <= len(buf) that ends a UTF-8 sequence.
+
+    Looks at most 3 bytes back for a lead byte whose sequence is not
+    complete yet, so a chunk never splits a multibyte character.
+    """
+    end = len(buf)
+    for back in range(1, min(4, end) + 1):
+        byte = buf[end - back]
+        if byte < 0x80:
+            return end
+        if byte >= 0xC0:
+            need = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return end if back >= need else end - back
+    return end
+
+
+class TextCensus:
+    """Incremental character-class counter.
+
+    update() can be fed str or UTF-8 bytes chunks of any size (a
+    multibyte character split between two bytes chunks is kept until
+    the next update), merge() adds another census (e.g. from a worker),
+    and result() gives the totals so far without rescanning anything.
+    """
+
+    def __init__(self) -> None:
+        """Start with all counters at zero."""
+        self.counts = [0, 0, 0, 0, 0, 0]
+        self.pending = b""
+
+    def update(self, chunk) -> None:
+        """Count one more str or bytes chunk."""
+        if isinstance(chunk, str):
+            if self.pending:  # an unfinished sequence can't complete now
+                self._add(count_text(self.pending))
+                self.pending = b""
+            self._add(count_text(chunk))
+            return
+        if self.pending:
+            chunk = self.pending + chunk
+        cut = _utf8_cut(chunk)
+        self.pending = chunk[cut:]
+        self._add(count_text(chunk[:cut]))
+
+    def read(self, stream, chunk_size=1 << 20, limit=None) -> None:
+        """Count a binary stream chunk by chunk (at most limit bytes)."""
+        while limit is None or limit > 0:
+            size = chunk_size if limit is None else min(chunk_size, limit)
+            chunk = stream.read(size)
+            if not chunk:
+                break
+            if limit is not None:
+                limit -= len(chunk)
+            self.update(chunk)
+
+    def merge(self, other) -> None:
+        """Add the totals of another TextCensus to this one."""
+        self._add(other.result())
+
+    def result(self) -> tuple:
+        """Return (total, upper, lower, punct, space, digit)."""
+        counts = self.counts
+        if self.pending:  # counted as invalid UTF-8, but kept for later
+            counts = [a + b for a, b in zip(counts, count_text(self.pending))]
+        return tuple(counts)
+
+    def _add(self, counts) -> None:
+        """Add a (total, upper, lower, punct, space, digit) tuple."""
+        for i, nb in enumerate(counts):
+            self.counts[i] += nb
+
+
+def count_stream(stream, chunk_size=1 << 20, limit=None):
+    """Count character classes of a binary UTF-8 stream, chunk by chunk.
+
+    Only one chunk of chunk_size bytes is held in memory at a time,
+    so huge inputs (log dumps, pipes) keep a flat footprint. If limit
+    is given, at most limit bytes are read.
+    Returns (total, upper, lower, punct, space, digit).
+    """
+    census = TextCensus()
+    census.read(stream, chunk_size, limit)
+    return census.result()
+
+
+def _continuation_len(data):
+    """Number of leading UTF-8 continuation bytes (0x80-0xBF) in data."""
+    nb = 0
+    while nb < len(data) and 0x80 <= data[nb] < 0xC0:
+        nb += 1
+    return nb
+
 
-    print(f"The text contains {len(text)} characters:")
+def _count_range(task):
+    """Worker: count the characters whose first byte is in [start, end).
+
+    Continuation bytes at `start` belong to the previous range and are
+    skipped; those right after `end` are pulled into this range. Both
+    sides apply the same rule, so no multibyte character is split or
+    counted twice.
+    """
+    path, start, end = task
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start)
+            start += _continuation_len(f.read(3))
+        f.seek(end)
+        end += _continuation_len(f.read(3))
+        f.seek(start)
+        census = TextCensus()
+        census.read(f, limit=end - start)
+    return census
+
+
+def count_mapped(path, window=16 << 20):
+    """Count character classes of a file through mmap.
+
+    The mapped buffer is scanned window by window (window bytes,
+    extended to the end of the last UTF-8 sequence), and pages already
+    scanned are released with madvise, so resident memory does not grow
+    with the file size.
+    Returns (total, upper, lower, punct, space, digit).
+    """
+    census = TextCensus()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return census.result()  # an empty file cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            can_release = hasattr(mm, "madvise") \
+                and hasattr(mmap, "MADV_DONTNEED")
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            start = 0
+            released = 0
+            while start < size:
+                end = min(start + window, size)
+                end += _continuation_len(mm[end:end + 3])
+                census.update(mm[start:end])
+                start = end
+                done = start - start % mmap.PAGESIZE
+                if can_release and done > released:
+                    mm.madvise(mmap.MADV_DONTNEED, released, done - released)
+                    released = done
+    return census.result()
+
+
+def _iter_files(paths):
+    """Yield the files of paths, walking directories recursively."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+
+def count_files(paths, jobs=None, task_size=64 << 20):
+    """Count character classes over files/directories with a Pool.
+
+    Every file is cut into byte ranges of about task_size; workers
+    open the file themselves (nothing but (path, start, end) is sent
+    to them) and the parent sums the partial counters. The totals are
+    the same as a single count_stream over each file.
+    Returns (total, upper, lower, punct, space, digit).
+    """
+    tasks = []
+    for path in _iter_files(paths):
+        size = os.path.getsize(path)
+        for start in range(0, size, task_size):
+            tasks.append((path, start, min(start + task_size, size)))
+
+    census = TextCensus()
+    with multiprocessing.Pool(jobs) as pool:
+        for part in pool.imap_unordered(_count_range, tasks):
+            census.merge(part)
+    return census.result()
+
+
+def print_report(total, upper, lower, punct, space, digit):
+    """Print the character breakdown."""
+    print(f"The text contains {total} characters:")
     print(f"{upper} upper letters")
     print(f"{lower} lower letters")
     print(f"{punct} punctuation marks")
@@ -47,6 +269,64 @@ def main():
     print(f"{digit} digits")
 
 
+def main():
+    """Analyze the text provided as argument or user input.
+
+    `--stream [PATH]` reads stdin (or PATH) in fixed-size chunks
+    instead of loading the whole text at once.
+    `--jobs N PATH...` counts files/directories with N processes.
+    `--file PATH` scans an mmap of PATH and reports the throughput.
+    """
+
+    # mmap mode: building.py --file PATH
+    if len(sys.argv) > 1 and sys.argv[1] == "--file":
+        if len(sys.argv) != 3:
+            print("AssertionError: the arguments are bad")
+            return
+        start = time.perf_counter()
+        report = count_mapped(sys.argv[2])
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(sys.argv[2])
+        print_report(*report)
+        print(f"{size} bytes in {elapsed:.3f} s "
+              f"({size / max(elapsed, 1e-9):.0f} bytes/sec)")
+        return
+
+    # parallel mode: building.py --jobs N PATH [PATH ...]
+    if len(sys.argv) > 1 and sys.argv[1] == "--jobs":
+        if len(sys.argv) < 4 or not sys.argv[2].isdigit() \
+                or int(sys.argv[2]) < 1:
+            print("AssertionError: the arguments are bad")
+            return
+        print_report(*count_files(sys.argv[3:], int(sys.argv[2])))
+        return
+
+    # streaming mode: building.py --stream [PATH]
+    if len(sys.argv) > 1 and sys.argv[1] == "--stream":
+        if len(sys.argv) > 3:
+            print("AssertionError: more than one argument is provided")
+            return
+        if len(sys.argv) == 3:
+            with open(sys.argv[2], "rb") as f:
+                print_report(*count_stream(f))
+        else:
+            print_report(*count_stream(sys.stdin.buffer))
+        return
+
+    # check args nb
+    if len(sys.argv) > 2:
+        print("AssertionError: more than one argument is provided")
+        return
+
+    if len(sys.argv) == 2:
+        text = sys.argv[1]
+    else:
+        text = input("Give me the text to count?\n")
+        # print(text)
+
+    print_report(*count_text(text))
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -69,6 +349,23 @@ if __name__ == "__main__":
 # 25 spaces
 # 15 digits
 # $>
+#
+# Streaming mode (constant memory, same report):
+# $> cat huge.log | python building.py --stream
+# $> python building.py --stream huge.log
+#
+# Parallel mode (files and/or directories, N worker processes):
+# $> python building.py --jobs 8 logs/ extra.log
+#
+# mmap mode (no copy of the file into a str, throughput reported):
+# $> python building.py --file huge.log
+#
+# Incremental API (e.g. over a tailing log, no rescan of history):
+# >>> census = TextCensus()
+# >>> census.update("Hello ")
+# >>> census.update(b"World! 42")
+# >>> census.result()  # (total, upper, lower, punct, space, digit)
+# (15, 2, 8, 1, 2, 2)
 
 # RULES
 # Any exception not caught will invalidate the exercises.
@@ -1,11 +1,102 @@
 #!/usr/bin/env python3
 
+import json
+import os
 import sys
 import ft_filter
+import word_index
+
+
+def iter_words(lines):
+    """Tokenize an iterable of lines (file, stdin) word by word."""
+    for line in lines:
+        yield from line.split()
+
+
+def _silence_stdout():
+    """Point stdout at devnull once its reader is gone (BrokenPipeError,
+    e.g. `| head -2`), so the flush at exit does not fail again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
+def stream_main(mode, arg_n, path=None):
+    """Stream the words longer than N from PATH (or stdin) to stdout.
+
+    mode is "--stream" (one word per line) or "--jsonl" (one JSON
+    string per line). Input is read line by line and every matching
+    word is written as soon as it is found, in constant memory.
+    """
+    try:
+        n = int(arg_n)
+    except ValueError:
+        print("AssertionError: the arguments are bad")
+        return
+    fmt = json.dumps if mode == "--jsonl" else str
+
+    try:
+        with (open(path, encoding="utf-8") if path else sys.stdin) \
+                as lines:
+            sys.stdout.writelines(
+                fmt(word) + "\n"
+                for word in filter_words(iter_words(lines), n)
+            )
+            sys.stdout.flush()  # a closed pipe fails here, not at exit
+    except BrokenPipeError:
+        _silence_stdout()  # the reader stopped early: exit quietly
+
+
+def index_main(mode, arg_a, arg_b=None):
+    """Build or query a length-bucketed word index (see word_index).
+
+    `--build-index DIR [PATH]` buckets the words of PATH (or stdin)
+    once; `--index DIR N` then prints the words longer than N by
+    reading only the buckets longer than N.
+    """
+    if mode == "--build-index":
+        path = arg_b
+        with (open(path, encoding="utf-8") if path else sys.stdin) as lines:
+            word_index.build_index(iter_words(lines), arg_a)
+        return
+    try:
+        n = int(arg_b)
+    except (TypeError, ValueError):
+        print("AssertionError: the arguments are bad")
+        return
+    try:
+        sys.stdout.writelines(
+            word + "\n" for word in word_index.query_index(arg_a, n)
+        )
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _silence_stdout()
+
+
+def filter_words(words, n):
+    """Lazily yield the words of a (possibly huge) word stream
+    that are longer than n.
+    """
+    return iter(ft_filter.FilterPipeline(words).filter(lambda w: len(w) > n))
 
 
 def main():
-    """Filter words from string that are longer than N."""
+    """Filter words from string that are longer than N.
+
+    `--stream N [PATH]` / `--jsonl N [PATH]` filter a file or stdin
+    as a stream instead (see stream_main).
+    `--build-index DIR [PATH]` / `--index DIR N` build and query a
+    length-bucketed index for repeated queries (see index_main).
+    """
+
+    if len(sys.argv) in (3, 4) \
+            and sys.argv[1] in ("--build-index", "--index"):
+        index_main(*sys.argv[1:])
+        return
+
+    if len(sys.argv) in (3, 4) and sys.argv[1] in ("--stream", "--jsonl"):
+        stream_main(*sys.argv[1:])
+        return
 
     # check arg num
     if len(sys.argv) != 3:
@@ -42,6 +133,20 @@ if __name__ == "__main__":
         print(f"Error: {e}")
 
 
+# Streaming mode (file or stdin, constant memory, pipe-friendly):
+# $> printf 'Hello the\nWorld\n' | python filterstring.py --stream 4
+# Hello
+# World
+# $> python filterstring.py --jsonl 4 corpus.txt | head -2
+# "Hello"
+# "World"
+
+# Index mode (bucket once, then each query only reads the output):
+# $> python filterstring.py --build-index idx/ corpus.txt
+# $> python filterstring.py --index idx/ 4
+# Hello
+# World
+
 # NOTES
 # ft_filter -> refers to the module (the whole file)
 # ft_filter.ft_filter -> refers to the function inside that module
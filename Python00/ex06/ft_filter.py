@@ -1,15 +1,117 @@
 #!/usr/bin/env python3
 
+import multiprocessing
+import sys
+from functools import partial
+from itertools import islice
+from multiprocessing.pool import ThreadPool
+
+
+def ft_vectorized(function):
+    """Mark function as NumPy-aware: called on a whole array, it
+    returns the boolean mask (e.g. lambda x: x > 5).
+    """
+    function.vectorized = True
+    return function
+
+
+def longer_than(n):
+    """Vectorized predicate len(item) > n, for str and str arrays."""
+    @ft_vectorized
+    def is_longer(item):
+        if isinstance(item, str):
+            return len(item) > n
+        import numpy as np
+        return np.char.str_len(item) > n
+    return is_longer
+
+
+def _is_ndarray(iterable):
+    """True for a NumPy array (without importing NumPy ourselves)."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(iterable, numpy.ndarray)
+
+
+def _filter_batch(function, batch):
+    """Worker: filter one batch (module level so it can be pickled)."""
+    return [item for item in batch if function(item)]
+
+
+def _parallel_filter(function, items, workers, threads):
+    """Shard items into batches, filter them in a pool, keep order."""
+    size = -(-len(items) // (workers * 4))  # ~4 batches per worker
+    batches = [items[i:i + size] for i in range(0, len(items), size)]
+    pool_type = ThreadPool if threads else multiprocessing.Pool
+    with pool_type(workers) as pool:
+        parts = pool.map(partial(_filter_batch, function), batches)
+    return [item for part in parts for item in part]
+
+
 # define a function -> stores the instructions for later use
-def ft_filter(function, iterable):
+def ft_filter(function, iterable, workers=None, threads=False,
+              min_parallel=10_000):
     """Return a list of elements from iterable where
     function(element) is True.
+
+    Fast path: for a NumPy array and a predicate marked with
+    ft_vectorized, the predicate is called once on the whole array
+    and the array is indexed with the mask (an array is returned).
+
+    workers=N (opt-in) shards the items across a process pool (a
+    thread pool with threads=True) for expensive predicates; the
+    output keeps the original order. A process pool needs a picklable
+    (module-level) function. Inputs shorter than min_parallel run
+    serially, since starting the pool would cost more than it saves.
     """
+    if getattr(function, "vectorized", False) and _is_ndarray(iterable):
+        return iterable[function(iterable)]
+    if workers is not None and workers > 1:
+        items = iterable if isinstance(iterable, (list, tuple)) \
+            else list(iterable)
+        if len(items) >= min_parallel:
+            return _parallel_filter(function, items, workers, threads)
+        iterable = items
     # Build and return a new list including items where
     # function(item) is True
     return [item for item in iterable if function(item)]
 
 
+def ft_ifilter(function, iterable):
+    """Lazy ft_filter: return a generator of the elements of iterable
+    where function(element) is True (nothing is stored).
+    """
+    return (item for item in iterable if function(item))
+
+
+class FilterPipeline:
+    """Chain lazy filter / map / take stages over an iterable.
+
+    Each stage wraps the previous one in a generator, so no
+    intermediate list is built and items flow one at a time:
+    FilterPipeline(words).filter(is_long).map(str.upper).take(10)
+    """
+
+    def __init__(self, iterable) -> None:
+        """Start a pipeline reading from iterable."""
+        self.iterable = iterable
+
+    def filter(self, function) -> "FilterPipeline":
+        """Keep only the items where function(item) is True."""
+        return FilterPipeline(ft_ifilter(function, self.iterable))
+
+    def map(self, function) -> "FilterPipeline":
+        """Replace every item by function(item)."""
+        return FilterPipeline(function(item) for item in self.iterable)
+
+    def take(self, n) -> "FilterPipeline":
+        """Stop after the first n items."""
+        return FilterPipeline(islice(self.iterable, n))
+
+    def __iter__(self):
+        """Run the pipeline lazily."""
+        return iter(self.iterable)
+
+
 if __name__ == "__main__":
     # Example usage
     def is_even(x):
@@ -17,6 +119,7 @@ if __name__ == "__main__":
 
     nbs = [1, 2, 3, 4, 5]
     print(ft_filter(is_even, nbs))
+    print(list(FilterPipeline(range(10**9)).filter(is_even).take(3)))
 
 # OUTPUT
 # $> python filterstring.py 'Hello the World' 4
@@ -49,4 +152,15 @@ if __name__ == "__main__":
 
 # lambda -> creates an anonymous (unnamed) function
 
+# ft_filter(ft_vectorized(lambda x: x > 5), np.arange(10))
+# -> array([6, 7, 8, 9]) : one mask over the array, no Python loop
+
+# ft_filter(is_valid_record, lines, workers=8)
+# -> same list, predicate evaluated in 8 processes (batches of lines)
+
+# ft_ifilter(function, iterable)
+# -> (item for item in iterable if function(item)) : generator expression
+# -> same filter, but lazy: items are produced one at a time while
+#    looping, so the input can be bigger than memory
+
 ################################
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Length-bucketed word index: bucket a corpus by word length once, then
+# answer "words longer than N" by reading only the buckets > N.
+
+import os
+
+
+def _marker_path(index_dir):
+    """Path of the file marking index_dir as built by build_index."""
+    return os.path.join(index_dir, ".word_index")
+
+
+def _bucket_path(index_dir, length):
+    """Path of the bucket file holding the words of this length."""
+    return os.path.join(index_dir, f"{length}.txt")
+
+
+def _bucket_lengths(index_dir):
+    """Sorted word lengths that have a bucket in index_dir."""
+    names = os.listdir(index_dir)
+    return sorted(int(name[:-4]) for name in names
+                  if name.endswith(".txt") and name[:-4].isdigit())
+
+
+def build_index(words, index_dir, flush_every=100_000):
+    """Bucket the words by length into index_dir (one file per length,
+    one word per line, corpus order kept inside a bucket).
+
+    Words are buffered and appended every flush_every words, so the
+    corpus is streamed in constant memory with no file left open.
+    An existing index in index_dir (a directory carrying the marker
+    file written here) is replaced; any other directory that already
+    holds <digits>.txt files is left untouched and FileExistsError is
+    raised, so user files are never deleted.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    lengths = _bucket_lengths(index_dir)
+    if lengths and not os.path.exists(_marker_path(index_dir)):
+        raise FileExistsError(f"{index_dir} is not a word index")
+    for length in lengths:
+        os.remove(_bucket_path(index_dir, length))
+    with open(_marker_path(index_dir), "w", encoding="utf-8"):
+        pass
+
+    buckets = {}
+    buffered = 0
+
+    def flush():
+        """Append the buffered words to their buckets, then clear them."""
+        for length, bucket in buckets.items():
+            path = _bucket_path(index_dir, length)
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(word + "\n" for word in bucket)
+        buckets.clear()
+
+    for word in words:
+        buckets.setdefault(len(word), []).append(word)
+        buffered += 1
+        if buffered == flush_every:
+            flush()
+            buffered = 0
+    flush()
+
+
+def query_index(index_dir, n):
+    """Yield the indexed words longer than n.
+
+    Only the buckets of length > n are read, so the cost is O(output)
+    (plus one directory listing), not O(corpus). Words come grouped by
+    length, shortest first. FileNotFoundError is raised if index_dir
+    was not built by build_index.
+    """
+    if not os.path.exists(_marker_path(index_dir)):
+        raise FileNotFoundError(f"{index_dir} is not a word index")
+    for length in _bucket_lengths(index_dir):
+        if length <= n:
+            continue
+        with open(_bucket_path(index_dir, length), encoding="utf-8") as f:
+            for line in f:
+                yield line[:-1]
+
+
+if __name__ == "__main__":
+    # Example usage
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        build_index("Hello the World of words".split(), tmp)
+        print(list(query_index(tmp, 4)))
+        print(list(query_index(tmp, 2)))
+
+# OUTPUT
+# $> python word_index.py
+# ['Hello', 'World', 'words']
+# ['the', 'Hello', 'World', 'words']
@@ -3,19 +3,21 @@
 # 1. create dict with morse code
 # 2. import dict and filter thru arg -> transform ascii to morse code
 
+import multiprocessing
+import os
 import sys
+from functools import lru_cache
+from itertools import islice
 
-# The morse map was previously a module-level variable; move it inside the
-# encoder to avoid module-level globals (exercise rule).
+# The morse map was previously a module-level variable; it is now built
+# by cached functions (once per process) instead of a module-level global
+# (exercise rule) or a rebuild on every call.
 
 
-def encode_to_morse(text):
-    """Convert a string into Morse code.
-
-    The morse mapping is created inside the function to avoid
-    module-level mutable globals. This keeps the module import-safe.
-    """
-    NESTED_MORSE = {
+@lru_cache(maxsize=None)
+def _morse_map():
+    """Return the character -> Morse code mapping (built once)."""
+    return {
         "A": ".- ",
         "B": "-... ",
         "C": "-.-. ",
@@ -55,20 +57,285 @@ def encode_to_morse(text):
         " ": "/ ",
     }
 
-    morse_code = ""
-    for char in text.upper():
-        if char not in NESTED_MORSE:
+
+def encode_to_morse(text):
+    """Convert a string into Morse code.
+
+    Each character is looked up in the prebuilt mapping and the codes
+    are joined once, so the cost is linear in the text length (no
+    repeated string concatenation). An unknown character shows up as a
+    KeyError of the lookup, which doubles as the validation.
+    """
+    try:
+        return "".join(map(_morse_map().__getitem__, text.upper())).strip()
+    except KeyError:
+        raise AssertionError("the arguments are bad") from None
+
+
+def _encode_batch(batch):
+    """Worker: encode a batch, returning errors instead of raising."""
+    results = []
+    for text in batch:
+        if not isinstance(text, str):  # e.g. an int: no .upper()
+            results.append(AssertionError("the arguments are bad"))
+            continue
+        try:
+            results.append(encode_to_morse(text))
+        except AssertionError as error:
+            results.append(error)
+    return results
+
+
+def encode_many(messages, workers=None, batch_size=1024):
+    """Encode a list or iterator of messages with a process pool.
+
+    Messages are dispatched in batches of batch_size (one pickle round
+    trip per batch, not per message) and the results come back in input
+    order. A message that cannot be encoded does not stop the batch:
+    its slot holds the AssertionError instead of the Morse string.
+    workers=1 encodes in the current process (no pool start-up).
+    """
+    messages = iter(messages)
+    batches = iter(lambda: list(islice(messages, batch_size)), [])
+    results = []
+    if workers == 1:
+        for batch in batches:
+            results.extend(_encode_batch(batch))
+        return results
+    with multiprocessing.Pool(workers) as pool:
+        for part in pool.imap(_encode_batch, batches):
+            results.extend(part)
+    return results
+
+
+@lru_cache(maxsize=None)
+def _decode_table():
+    """Build (once) the code -> text decoding table.
+
+    Besides the plain codes ("/" is the word space), it holds every
+    code followed by a newline and the bare newline, so a stream of
+    several lines decodes with the same single lookup per code.
+    """
+    table = {"\n": "\n"}
+    for char, code in _morse_map().items():
+        table[code.strip()] = char
+        table[code.strip() + "\n"] = char + "\n"
+    return table
+
+
+def _decode_codes(codes):
+    """Decode space-separated codes with C-level split/map/join only."""
+    try:
+        return "".join(map(_decode_table().__getitem__, codes.split(" ")))
+    except KeyError:
+        # unknown symbol, code too long, or empty code (double space)
+        raise AssertionError("the arguments are bad") from None
+
+
+def decode_stream(chunks):
+    """Decode an iterable of Morse chunks, yielding text per chunk.
+
+    Every complete code of a chunk is decoded at once (split on spaces,
+    then table lookups through map), without a Python-level loop over
+    symbols. The unfinished last code is carried to the next chunk, so
+    memory is bounded by the size of one chunk. A newline ends the
+    current code and is passed through (one message a line).
+    """
+    carry = ""
+    for chunk in chunks:
+        # a newline closes its code: "A\nB" -> ".-\n -..."
+        pending = carry + chunk.replace("\n", "\n ")
+        cut = pending.rfind(" ")
+        carry = pending[cut + 1:]
+        if len(carry) > 6:  # longer than any code (5 symbols + newline)
+            raise AssertionError("the arguments are bad")
+        if cut >= 0:
+            yield _decode_codes(pending[:cut])
+    if carry:
+        yield _decode_codes(carry)
+
+
+def decode_from_morse(code):
+    """Convert Morse code (as made by encode_to_morse) back to text.
+
+    Codes are separated by one space and "/" is the word separator.
+    The input is decoded in bounded 64 KiB slices (see decode_stream).
+    """
+    step = 1 << 16
+    chunks = (code[i:i + step] for i in range(0, len(code), step))
+    return "".join(decode_stream(chunks))
+
+
+def encode_stream(chunks):
+    """Encode an iterable of text chunks, yielding Morse per chunk.
+
+    Chunks may be cut anywhere (the pieces are joined with the same
+    single space encode_to_morse uses). Newlines are passed through,
+    so every input line becomes one line of Morse.
+    """
+    started = False
+    for chunk in chunks:
+        pieces = []
+        for i, line in enumerate(chunk.split("\n")):
+            if i:
+                pieces.append("\n")
+                started = False
+            code = encode_to_morse(line)
+            if code:
+                if started:
+                    pieces.append(" ")
+                pieces.append(code)
+                started = True
+        yield "".join(pieces)
+
+
+def read_chunks(stream, size=1 << 16):
+    """Yield fixed-size chunks read from a text stream until EOF."""
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+@lru_cache(maxsize=None)
+def _key_units():
+    """str.translate table: Morse symbol -> key on(1)/off(0) units.
+
+    Standard timing: dot 1 unit, dash 3, 1 unit between the elements of
+    a code, 3 between codes and 7 between words. Every element carries
+    its trailing 1-unit gap, so a space adds 2 and "/ " adds 2 + 2.
+    A newline (next message) is a word gap too.
+    """
+    return str.maketrans({".": "10", "-": "1110", " ": "00", "/": "00",
+                          "\n": "000000"})
+
+
+def iter_key_units(chunks):
+    """Yield the on/off key units of Morse chunks as uint8 arrays.
+
+    The whole chunk is expanded with one str.translate and read by
+    NumPy as a byte buffer: no Python-level loop over symbols. A chunk
+    with any character other than ".-/ " and newline is rejected first
+    (strip stops at the first foreign character, at C speed), so a
+    literal "0" or "1" cannot pass as a key unit.
+    """
+    import numpy as np  # optional dependency, only for rendering
+
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    for chunk in chunks:
+        if chunk.strip(".-/ \n"):  # a character that is not Morse
             raise AssertionError("the arguments are bad")
-        morse_code += NESTED_MORSE[char]
-    return morse_code.strip()
+        yield np.frombuffer(
+            chunk.translate(_key_units()).encode("utf-8"), dtype=np.uint8
+        ) - ord("0")
+
+
+def iter_pcm(chunks, wpm=20, rate=8000, freq=600.0, block=1 << 16):
+    """Yield 16-bit mono PCM (bytes) of the Morse tone, block by block.
+
+    The tone is generated with NumPy over whole blocks of at most
+    `block` samples (np.repeat of the key units times a sine whose
+    phase continues across blocks), so a one-hour transmission is
+    never held in memory at once.
+    """
+    import numpy as np
+
+    unit = max(1, round(rate * 1.2 / wpm))  # PARIS: 1 unit = 1.2 / wpm s
+    step = max(1, block // unit)
+    omega = 2 * np.pi * freq / rate
+    start = 0
+    for units in iter_key_units(chunks):
+        for i in range(0, len(units), step):
+            key = np.repeat(units[i:i + step], unit)
+            phase = omega * np.arange(start, start + len(key))
+            start += len(key)
+            yield (np.sin(phase) * key * 16383).astype("<i2").tobytes()
+
+
+def iter_bits(chunks):
+    """Yield the key units packed 8 per byte (np.packbits, MSB first).
+
+    Units left over from a chunk are carried to the next one; the last
+    byte is padded with key-off units.
+    """
+    import numpy as np
+
+    carry = np.zeros(0, dtype=np.uint8)
+    for units in iter_key_units(chunks):
+        units = np.concatenate((carry, units))
+        cut = len(units) - len(units) % 8
+        carry = units[cut:]
+        yield np.packbits(units[:cut]).tobytes()
+    if len(carry):
+        yield np.packbits(carry).tobytes()
+
+
+def write_wav(path, chunks, wpm=20, rate=8000, freq=600.0):
+    """Render Morse chunks (or one Morse string) as a WAV file.
+
+    If rendering fails (e.g. invalid Morse), the partial file is
+    removed instead of being left as a header-only WAV.
+    """
+    import wave
+
+    # open the file first: a bad path then fails before wave builds
+    # a half-initialised writer (whose __del__ would raise as well)
+    with open(path, "wb") as f:
+        try:
+            with wave.open(f, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(rate)
+                for pcm in iter_pcm(chunks, wpm, rate, freq):
+                    wav.writeframes(pcm)
+        except Exception:
+            f.close()
+            os.remove(path)
+            raise
+
+
+def _silence_stdout():
+    """Point stdout at devnull once its reader is gone (BrokenPipeError,
+    e.g. `| head -1`), so the flush at exit does not fail again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
 
 
 def main():
     """Main entry point.
 
     Handles command-line arguments and prints Morse code.
+    `--encode` / `--decode` stream stdin to stdout chunk by chunk.
+    `--wav PATH [WPM]` / `--bits` render Morse read from stdin (they
+    need NumPy).
     """
     try:
+        # rendering mode: sos.py --wav PATH [WPM] | --bits
+        if len(sys.argv) in (3, 4) and sys.argv[1] == "--wav":
+            if len(sys.argv) == 4 and not sys.argv[3].isdigit():
+                raise AssertionError("the arguments are bad")
+            wpm = int(sys.argv[3]) if len(sys.argv) == 4 else 20
+            write_wav(sys.argv[2], read_chunks(sys.stdin), max(wpm, 1))
+            return
+        if len(sys.argv) == 2 and sys.argv[1] == "--bits":
+            for packed in iter_bits(read_chunks(sys.stdin)):
+                sys.stdout.buffer.write(packed)
+            sys.stdout.flush()
+            return
+
+        # streaming mode: sos.py --encode | --decode
+        if len(sys.argv) == 2 and sys.argv[1] in ("--encode", "--decode"):
+            stream = encode_stream if sys.argv[1] == "--encode" \
+                else decode_stream
+            write = sys.stdout.write  # buffered, flushed at exit
+            for piece in stream(read_chunks(sys.stdin)):
+                write(piece)
+            sys.stdout.flush()  # a closed pipe fails here, not at exit
+            return
+
         # check args
         if len(sys.argv) != 2:
             raise AssertionError("the arguments are bad")
@@ -80,6 +347,12 @@ def main():
         print(morse, end="")
     except AssertionError as error:
         print(f"AssertionError: {error}")
+    except BrokenPipeError:
+        _silence_stdout()  # the reader stopped early: exit quietly
+    except ImportError as error:  # NumPy is needed by --wav / --bits
+        print(f"ImportError: {error}")
+    except OSError as error:  # e.g. --wav into a missing directory
+        print(f"{type(error).__name__}: {error}")
 
 
 if __name__ == "__main__":
@@ -93,6 +366,20 @@ if __name__ == "__main__":
 # $> python sos.py 'h$llo'
 # AssertionError: the arguments are bad
 # $>
+# >>> decode_from_morse("... --- ... / ....- ..---")
+# 'SOS 42'
+# >>> encode_many(["sos", "h$llo", "42"], workers=2)
+# ['... --- ...', AssertionError('the arguments are bad'), '....- ..---']
+# $> printf 'sos\nhi 42\n' | python sos.py --encode
+# ... --- ...
+# .... .. / ....- ..---
+# $> printf 'sos\nhi 42\n' | python sos.py --encode | python sos.py --decode
+# SOS
+# HI 42
+# $> python sos.py --encode < msg.txt | python sos.py --wav msg.wav 25
+# $> python sos.py "sos" | python sos.py --bits | xxd -b
+# 00000000: 10101000 11101110 11100010 10100000  ....
+
 
 # NOTES ###
 # morse code
@@ -3,37 +3,430 @@
 # Generators (using yield)
 # Dynamic terminal output (progress bar)
 
+import asyncio
+import multiprocessing
+import sys
+import threading
+import time
+from itertools import chain, count, islice
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+
+def _format_time(seconds: float | None) -> str:
+    """Format seconds as MM:SS (H:MM:SS past one hour), "?" if unknown."""
+    if seconds is None:
+        return "?"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _format_count(nb: float, unit_scale: bool, divisor: int) -> str:
+    """Format a count, with k/M/G/T/P prefixes if unit_scale is set."""
+    if not unit_scale:
+        return f"{nb:.2f}" if isinstance(nb, float) else str(nb)
+    for prefix in ("", "k", "M", "G", "T"):
+        if abs(nb) < 999.5:
+            return f"{nb:.2f}{prefix}" if prefix else f"{nb:g}"
+        nb /= divisor
+    return f"{nb:.2f}P"
+
+
+class _BarStats:
+    """Elapsed time, smoothed rate and ETA of one bar.
+
+    The clock is only read when the bar is redrawn, never per item.
+    The rate is an exponential moving average of the rates measured
+    between two redraws (weight `smoothing` for the newest one).
+    """
+
+    def __init__(self, unit="it", unit_scale=False, unit_divisor=1000,
+                 smoothing=0.3) -> None:
+        """Start the clock."""
+        self.unit = unit
+        self.unit_scale = unit_scale
+        self.unit_divisor = unit_divisor
+        self.smoothing = smoothing
+        self.start = self.last_time = time.perf_counter()
+        self.last_i = None
+        self.rate = None
+
+    def update(self, i: int) -> float:
+        """Fold the progress up to item i into the rate; return elapsed."""
+        now = time.perf_counter()
+        if self.last_i is not None and i > self.last_i \
+                and now > self.last_time:
+            rate = (i - self.last_i) / (now - self.last_time)
+            self.rate = rate if self.rate is None else \
+                self.smoothing * rate + (1 - self.smoothing) * self.rate
+        if self.last_i is None or now > self.last_time:
+            self.last_i, self.last_time = i, now
+        return now - self.start
+
+    def format_count(self, i: int) -> str:
+        """Return "i unit [elapsed, rate unit/s]" (unknown total)."""
+        elapsed = self.update(i)
+        scale, div = self.unit_scale, self.unit_divisor
+        rate = "?" if self.rate is None else \
+            _format_count(self.rate, scale, div)
+        return (f"{_format_count(i, scale, div)}{self.unit}"
+                f" [{_format_time(elapsed)}, {rate}{self.unit}/s]")
+
+    def format(self, i: int, total: int) -> str:
+        """Return " i/total [elapsed<eta, rate unit/s]"."""
+        elapsed = self.update(i)
+        eta = (total - i) / self.rate if self.rate else None
+        scale, div = self.unit_scale, self.unit_divisor
+        rate = "?" if self.rate is None else \
+            _format_count(self.rate, scale, div)
+        return (f" {_format_count(i, scale, div)}"
+                f"/{_format_count(total, scale, div)}"
+                f" [{_format_time(elapsed)}<{_format_time(eta)},"
+                f" {rate}{self.unit}/s]")
+
+
+def _bar_line(i: int, total: int, stats: _BarStats) -> str:
+    """Return the bar line for item i of total."""
+    # integer maths: exact, and the same values _next_redraw predicts
+    percent = 100 * i // total
+    to_fill = min(50 * i // total, 50)  # "filled" blocks of the bar
+    bar = "=" * to_fill + ">" + " " * (50 - to_fill)
+    return f"{percent}%|[{bar}]|{stats.format(i, total)}"
+
+
+def _draw(i: int, total: int, stats: _BarStats) -> None:
+    """Print the bar for item i of total, on the current line.
+
+    The rate and ETA change width, so the rest of the previous line is
+    erased (ANSI "erase to end of line") instead of left on screen.
+    """
+    print(f"\r{_bar_line(i, total, stats)}\x1b[K", end="")
+
+
+def _next_redraw(i: int, total: int, miniters: int | None) -> int:
+    """Return the first item after i whose percentage or bar width
+    differs from item i (or i + miniters if that comes first).
+    """
+    # smallest j with 100 * j // total == current percent + 1, etc.
+    next_percent = -(-(100 * i // total + 1) * total // 100)
+    next_fill = -(-(50 * i // total + 1) * total // 50)
+    nxt = min(next_percent, next_fill, total)
+    if miniters:
+        nxt = min(nxt, i + miniters)
+    return max(nxt, i + 1)
+
+
+def _draw_count(i: int, stats: _BarStats) -> None:
+    """Print the counter line used when the total is unknown."""
+    print(f"\r{stats.format_count(i)}\x1b[K", end="")
+
+
+def _ft_tqdm_unsized(items: Iterator, stats: _BarStats, i: int,
+                     miniters: int | None, mininterval: float) -> Iterator:
+    """Counter + rate display for an iterator of unknown length.
+
+    Redraws every `step` items, where step is re-derived from the
+    smoothed rate to give about one redraw per mininterval seconds
+    (or fixed to miniters). The items in between go through a C-level
+    zip with an itertools.count, which tells how many were consumed
+    without any Python code per item.
+    """
+    step = miniters or 1
+    counter = count()
+    start = i
+    while True:
+        for elem in islice(items, 1):
+            break
+        else:
+            break
+        i += 1
+        _draw_count(i, stats)
+        yield elem
+        before = next(counter)
+        yield from map(itemgetter(0), zip(islice(items, step - 1), counter))
+        i += next(counter) - before - 1
+        if not miniters:
+            step = max(1, int(stats.rate * mininterval)) if stats.rate \
+                else 2 * step
+    if i > start or not start:  # final count (unless nothing was left)
+        _draw_count(i, stats)
+
+
 # ft_tqdm(range(333)) is a generator, not a list
-def ft_tqdm(lst: range) -> None:
+def ft_tqdm(lst: Iterable, total: int | None = None,
+            miniters: int | None = None, mininterval: float = 0.1,
+            unit: str = "it", unit_scale: bool = False,
+            unit_divisor: int = 1000, smoothing: float = 0.3) -> Iterator:
     """
     Recreates the tqdm loading bar using a generator and yield.
-    Displays progress in the same line as it iterates.
+    Displays progress in the same line as it iterates, followed by
+    the elapsed time, the ETA and the smoothed rate, like tqdm:
+    100%|[====>]| 333/333 [00:01<00:00, 191.61it/s]
+
+    The bar is only redrawn when its percentage or width changes
+    (at most ~150 times in total), or every `miniters` items if given.
+    The items in between are passed through with `yield from islice`,
+    so the per-item cost is a plain generator step (the clock is only
+    read on redraws). For bytes use unit="B", unit_scale=True,
+    unit_divisor=1024.
+
+    Works on any iterable (generators, files, sockets...): the total
+    is `total` or len(lst). When neither is known, a counter with the
+    rate is shown instead of the bar (redrawn about every mininterval
+    seconds). Items are still pulled lazily, one at a time.
     """
 
     # calculate the nb of elements in a list
-    total_elems = len(lst)
+    if total is None:
+        try:
+            total = len(lst)
+        except TypeError:
+            total = None
+    items = iter(lst)
+    stats = _BarStats(unit, unit_scale, unit_divisor, smoothing)
+    if total is None:
+        yield from _ft_tqdm_unsized(items, stats, 0, miniters, mininterval)
+        return
+    if not total:  # no percentage of zero items: nothing to draw
+        yield from items
+        return
 
-    # loop to enumerate(lst, start=1)
-    # -> give both the index (i) and the element (elem)
-    for i, elem in enumerate(lst, start=1):
+    i = 0
+    counter = count()
+    while i < total:
+        # Fetch the next element first: the iterable may be shorter
+        for elem in islice(items, 1):
+            break
+        else:
+            _draw(i, total, stats)  # shorter than total: final count
+            return
+        i += 1
+        _draw(i, total, stats)
+        # Yield current element so loop continues
+        yield elem
+        # pass the next items through untouched until the bar changes,
+        # counted by a C-level zip (the iterable may end in between)
+        nxt = _next_redraw(i, total, miniters)
+        before = next(counter)
+        yield from map(itemgetter(0),
+                       zip(islice(items, nxt - i - 1), counter))
+        i += next(counter) - before - 1
+    # more items than announced: leave the finished bar on its line and
+    # keep going as a counter on the next one
+    for elem in islice(items, 1):
+        print()
+        yield from _ft_tqdm_unsized(chain((elem,), items), stats, i,
+                                    miniters, mininterval)
 
-        # Calculate progress ratio (0.0 -> 1.0)
-        # -> progress / total nb of elements
-        progress_percent = i / total_elems
 
-        # Bar width and filled part
-        bar_len = 50  # total characters in the progress bar
-        to_fill = int(50 * progress_percent)
-        # Calculates how many blocks of the bar should be "filled"
+class _LatestLineWriter:
+    """Buffered, rate-limited terminal writer for the event loop.
 
-        # Print formatted progress bar on same line
-        bar = "=" * to_fill + ">" + " " * (bar_len - to_fill)
-        percent = int(progress_percent * 100)
-        s = f"\r{percent}%|[{bar}]| {i}/{total_elems}"
-        print(s, end="")
+    submit() only stores the newest line; one write is scheduled with
+    loop.call_later so the terminal is touched at most once every
+    `interval` seconds, whatever the number of submits.
+    """
 
-        # Yield current element so loop continues
-        yield elem
+    def __init__(self, interval: float) -> None:
+        """Bind to the running event loop."""
+        self.loop = asyncio.get_running_loop()
+        self.interval = interval
+        self.line = None
+        self.handle = None
+
+    def submit(self, line: str) -> None:
+        """Remember line; schedule a write unless one is pending."""
+        self.line = line
+        if self.handle is None:
+            self.handle = self.loop.call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Write the newest line now."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        if self.line is not None:
+            sys.stdout.write(f"\r{self.line}\x1b[K")
+            sys.stdout.flush()
+            self.line = None
+
+
+async def ft_atqdm(aiterable, total: int | None = None,
+                   mininterval: float = 0.1, **stats_options):
+    """
+    Async version of ft_tqdm, for `async for` over async iterables.
+
+    Lines are built only when the bar changes (with a total) or every
+    `step` items (counter mode, step adapted to the rate; like ft_tqdm,
+    also used past `total`), and handed to a _LatestLineWriter: the
+    terminal is written at most once per mininterval, from a loop
+    callback, so progress never adds to the latency of the ingestion
+    loop.
+    """
+    stats = _BarStats(**stats_options)
+    writer = _LatestLineWriter(mininterval)
+    i = 0
+    nxt = 1
+    step = 1
+    try:
+        async for elem in aiterable:
+            i += 1
+            if i >= nxt:
+                if total and i <= total:
+                    writer.submit(_bar_line(i, total, stats))
+                    nxt = _next_redraw(i, total, None) if i < total \
+                        else i + 1
+                else:
+                    if total and i == total + 1:
+                        # more items than announced: leave the finished
+                        # bar on its line, count on the next one
+                        writer.submit(_bar_line(total, total, stats))
+                        writer.flush()
+                        sys.stdout.write("\n")
+                    writer.submit(stats.format_count(i))
+                    step = max(1, int(stats.rate * mininterval)) \
+                        if stats.rate else 2 * step
+                    nxt = i + step
+            yield elem
+    finally:
+        writer.submit(_bar_line(i, total, stats) if total and i <= total
+                      else stats.format_count(i))
+        writer.flush()
+
+
+class _WorkerProgress:
+    """Progress handle of one worker: one slot of a shared RawArray.
+
+    Only this worker writes its slot, so no lock is needed. A handle
+    from ProgressAggregator.worker(k) is bound to slot k: give one to
+    each thread, or to each Process through its args. A handle from
+    pool_worker() has no slot yet; every process that receives a copy
+    (Pool initargs pickles one per process) claims a free slot, under
+    the lock of a shared counter, on its first update.
+    """
+
+    def __init__(self, counts, slot: int | None,
+                 next_slot=None) -> None:
+        """Bind the handle to counts[slot] (claimed later if None)."""
+        self.counts = counts
+        self.slot = slot
+        self.next_slot = next_slot
+
+    def _claim(self) -> int:
+        """Take the next free slot for this process."""
+        with self.next_slot.get_lock():
+            slot = self.next_slot.value
+            if slot >= len(self.counts):
+                raise ValueError("more pool processes than progress slots")
+            self.next_slot.value += 1
+        self.slot = slot
+        return slot
+
+    def update(self, n: int = 1) -> None:
+        """Add n done items to this worker's counter."""
+        slot = self.slot if self.slot is not None else self._claim()
+        self.counts[slot] += n
+
+    def track(self, iterable: Iterable, every: int = 1) -> Iterator:
+        """Yield the items of iterable, counting them every `every`
+        items (raise it for cheap items; the count is C-level).
+        """
+        items = iter(iterable)
+        counter = count()
+        while True:
+            before = next(counter)
+            yield from map(itemgetter(0),
+                           zip(islice(items, every), counter))
+            done = next(counter) - before - 1
+            self.update(done)
+            if done < every:
+                return
+
+
+class ProgressAggregator:
+    """One progress display for many threads or processes.
+
+    Workers never print: each one adds to its own slot of a shared,
+    lock-free multiprocessing.RawArray (see worker(), or pool_worker()
+    for a Pool, whose processes all get the same initargs). A single
+    renderer thread reads the slots every `refresh` seconds and draws
+    either one combined bar (a counter if total is None), or one line
+    per worker with per_worker=True.
+
+        with ProgressAggregator(total=N, workers=4) as progress:
+            threads = [Thread(target=job, args=(progress.worker(k),))
+                       for k in range(4)]
+    """
+
+    def __init__(self, total: int | None = None, workers: int = 1,
+                 per_worker: bool = False, refresh: float = 0.1,
+                 **stats_options) -> None:
+        """Allocate the shared counters (stats_options: see ft_tqdm)."""
+        self.counts = multiprocessing.RawArray("q", workers)
+        self.total = total
+        self.per_worker = per_worker
+        self.refresh = refresh
+        nb_stats = workers if per_worker else 1
+        self.stats = [_BarStats(**stats_options) for _ in range(nb_stats)]
+        self.next_slot = multiprocessing.Value("i", 0)
+        self._lines = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def worker(self, slot: int) -> _WorkerProgress:
+        """Return the progress handle of worker number `slot`."""
+        return _WorkerProgress(self.counts, slot)
+
+    def pool_worker(self) -> _WorkerProgress:
+        """Return a handle for Pool initargs: each pool process claims
+        its own slot (slots must cover the pool size, and are shared
+        with worker(k), so do not mix both on one aggregator).
+        """
+        return _WorkerProgress(self.counts, None, self.next_slot)
+
+    def start(self) -> "ProgressAggregator":
+        """Start the renderer thread."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the renderer and draw the final state."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._render()
+        print()
+
+    def __enter__(self) -> "ProgressAggregator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Renderer loop: redraw at a fixed rate until closed."""
+        while not self._stop.wait(self.refresh):
+            self._render()
+
+    def _render(self) -> None:
+        """Draw all lines in place (ANSI cursor-up over the old ones)."""
+        done = self.counts[:]
+        if self.per_worker:
+            lines = [f"w{slot}: {stats.format_count(nb)}"
+                     for slot, (nb, stats) in enumerate(zip(done,
+                                                            self.stats))]
+        elif self.total:
+            lines = [_bar_line(sum(done), self.total, self.stats[0])]
+        else:
+            lines = [self.stats[0].format_count(sum(done))]
+        up = f"\x1b[{self._lines - 1}A" if self._lines > 1 else ""
+        print(f"{up}\r" + "\x1b[K\n".join(lines) + "\x1b[K", end="",
+              flush=True)
+        self._lines = len(lines)
 
 
 # NOTES
@@ -64,8 +457,12 @@ def ft_tqdm(lst: range) -> None:
 # moves the cursor to the beginning of the same line so the next
 # print overwrites the previous one
 
-# int(percent * 100)
-# shows the progress percentage as a whole number
+# 100 * i // total
+# shows the progress percentage as a whole number (integer division)
+
+# yield from islice(items, n)
+# hands the next n items to the caller without running our code for
+# each of them -> the bar is only redrawn when it actually changes
 
 # Example iterations (illustrative, wrapped to fit 79 chars):
 # Iteration 1: "\r 0%|[>                                             ]| 0/100"
@@ -1,8 +1,36 @@
 #!/usr/bin/env python3
 
+from multiprocessing import Pool
 from time import sleep
 from tqdm import tqdm
-from Loading import ft_tqdm
+from Loading import ProgressAggregator, ft_tqdm
+
+# progress handle of the current pool process (set by pool_init)
+pool_progress = None
+
+
+def pool_init(handle) -> None:
+    """Pool initializer: keep this process's progress handle."""
+    global pool_progress
+    pool_progress = handle
+
+
+def pool_job(nb_items: int) -> int:
+    """Pool task: report nb_items done items, one update() each."""
+    for _ in range(nb_items):
+        pool_progress.update()
+    return nb_items
+
+
+def check_pool_progress(processes: int = 4, tasks: int = 8,
+                        nb_items: int = 200_000) -> None:
+    """Every update() of every pool process must reach the total."""
+    total = tasks * nb_items
+    with ProgressAggregator(total=total, workers=processes) as progress:
+        with Pool(processes, pool_init, (progress.pool_worker(),)) as pool:
+            done = sum(pool.map(pool_job, [nb_items] * tasks))
+    assert done == total and sum(progress.counts) == total, \
+        f"progress lost: {sum(progress.counts)}/{total}"
 
 
 def main() -> None:
@@ -19,6 +47,10 @@ def main() -> None:
         sleep(0.005)
     print()
 
+    # one progress bar shared by a process pool
+    print("=== SHARED : ProgressAggregator + Pool ===")
+    check_pool_progress()
+
 
 if __name__ == "__main__":
     main()
@@ -27,5 +59,6 @@ if __name__ == "__main__":
 # OUTPUT
 # Example run (truncated):
 # $> python tester.py
-# 100%|[=========================================>]| 333/333
+# 100%|[==================>]| 333/333 [00:01<00:00, 191.61it/s]
 # 100%| | 333/333 [00:01<00:00, 191.61it/s]
+# 100%|[==================>]| 1600000/1600000 [00:02<00:00, ...it/s]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Benchmark: serial counting (list.count on a list, np.count_nonzero on
+# an array) vs count_in_list_parallel over a SharedArray, to find the
+# size where the process pool starts to pay off on this machine.
+
+import sys
+import time
+
+import numpy as np
+
+from ft_package import SharedArray, count_in_list_parallel
+
+
+def bench(func, *args):
+    """Return (result, seconds) of func(*args)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Usage: bench_parallel.py [WORKERS] [SIZE ...]  (e.g. 8 1e6 1e8)"""
+    try:
+        workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+        sizes = [int(float(size)) for size in sys.argv[2:]] \
+            or [10_000, 1_000_000, 10_000_000]
+    except ValueError:
+        print("AssertionError: the arguments are bad")
+        return
+
+    print(f"{'size':>12} | {'list (s)':>8} | {'numpy (s)':>9} | "
+          f"{f'{workers} procs (s)':>13}")
+    for size in sizes:
+        data = np.arange(size) % 7
+        if size <= 10_000_000:  # a list of 1e8 ints needs ~4 GB
+            _, t_list = bench(data.tolist().count, 3)
+            t_list = f"{t_list:8.3f}"
+        else:
+            t_list = f"{'-':>8}"
+        expected, t_numpy = bench(count_in_list_parallel, data, 3, 1)
+        with SharedArray(data) as shared:
+            result, t_parallel = bench(count_in_list_parallel, shared, 3,
+                                       workers, 0)
+        assert result == expected
+        print(f"{size:>12} | {t_list} | {t_numpy:9.3f} | "
+              f"{t_parallel:13.3f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# OUTPUT
+# Measured on a single-core machine: the 2 processes share one core,
+# so the last column shows the pool overhead, not a speedup.
+# $> python bench_parallel.py 2 1e4 1e6 1e7 3e7
+#         size | list (s) | numpy (s) |   2 procs (s)
+#        10000 |    0.000 |     0.000 |         0.039
+#      1000000 |    0.012 |     0.001 |         0.014
+#     10000000 |    0.124 |     0.012 |         0.029
+#     30000000 |        - |     0.034 |         0.058
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 
 from .count_in_list import count_in_list
+from .count_index import CountIndex
+from .count_many import count_many
+from .parallel_count import SharedArray, count_in_list_parallel
+from .sketches import CountMinSketch, SpaceSaving
+from .stream_counter import StreamCounter, count_in_stream
 
 __version__ = "0.0.1"
 __author__ = "hottie"
@@ -25,4 +30,14 @@ __author__ = "hottie"
 # $>
 
 # Export public API names (referencing count_in_list marks it as used)
-__all__ = [count_in_list.__name__]
+__all__ = [
+    count_in_list.__name__,
+    CountIndex.__name__,
+    count_many.__name__,
+    count_in_stream.__name__,
+    StreamCounter.__name__,
+    CountMinSketch.__name__,
+    SpaceSaving.__name__,
+    count_in_list_parallel.__name__,
+    SharedArray.__name__,
+]
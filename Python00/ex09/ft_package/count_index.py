@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+from collections import Counter
+
+
+class CountIndex:
+    """
+    Frequency index of a list: built once in O(n), then answers
+    "how many times does item appear?" in O(1) per query.
+
+    Keep it in sync with the list by mirroring its mutations:
+    lst.append(x) -> index.add(x), lst.remove(x) -> index.remove(x).
+    """
+
+    def __init__(self, lst=()):
+        """
+        Args:
+            lst (iterable): The items to index (hashable).
+        """
+        self.counts = Counter(lst)
+
+    def count(self, item):
+        """Return the number of occurrences of item (0 if absent)."""
+        return self.counts.get(item, 0)
+
+    def add(self, item, n=1):
+        """Record n more occurrences of item (like lst.append)."""
+        self.counts[item] += n
+
+    def extend(self, items):
+        """Record every item of an iterable (like lst.extend)."""
+        self.counts.update(items)
+
+    def remove(self, item):
+        """
+        Forget one occurrence of item (like lst.remove).
+
+        Raises:
+            ValueError: If item is not in the index.
+        """
+        nb = self.counts.get(item, 0)
+        if not nb:
+            raise ValueError(f"{item!r} is not in the index")
+        if nb == 1:
+            del self.counts[item]
+        else:
+            self.counts[item] = nb - 1
+
+    def __len__(self):
+        """Total number of indexed items (like len(lst))."""
+        return sum(self.counts.values())
+
+# Example
+# from ft_package import CountIndex
+# index = CountIndex(["toto", "tata", "toto"])
+# print(index.count("toto"))  # output: 2
+# index.remove("toto")
+# print(index.count("toto"))  # output: 1
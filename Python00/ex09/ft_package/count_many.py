@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import sys
+from collections import Counter
+
+
+def _is_numeric_array(lst):
+    """True for a NumPy array of bools/ints/floats (no NumPy import)."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(lst, numpy.ndarray) \
+        and lst.dtype.kind in "biuf"
+
+
+def count_many(lst, items):
+    """
+    Counts how many times each of `items` appears in `lst`, in one pass.
+
+    One count_in_list call per item costs k x O(n); this scans `lst`
+    once (O(n + k)). For a numeric NumPy array, np.unique with
+    return_counts=True does the counting in C instead. A list holding
+    unhashable elements falls back to one lst.count per item.
+
+    Args:
+        lst (list | numpy.ndarray): The list to search.
+        items (iterable): The (hashable) items to count.
+
+    Returns:
+        dict: {item: number of occurrences of item in lst}.
+    """
+    items = list(items)
+    if _is_numeric_array(lst):
+        import numpy as np
+        values, counts = np.unique(lst, return_counts=True)
+        found = dict(zip(values.tolist(), counts.tolist()))
+        return {item: found.get(item, 0) for item in items}
+
+    wanted = set(items)
+    try:
+        # filter + Counter run in C: only the wanted items are counted
+        counts = Counter(filter(wanted.__contains__, lst))
+    except TypeError:
+        # an unhashable element (e.g. a list): one lst.count per item,
+        # like count_in_list
+        return {item: lst.count(item) for item in items}
+    return {item: counts[item] for item in items}
+
+# Example
+# from ft_package import count_many
+# print(count_many(["toto", "tata", "toto"], ["toto", "tutu"]))
+# # output: {'toto': 2, 'tutu': 0}
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+import hashlib
+import heapq
+import math
+from array import array
+from itertools import count
+
+
+def _hashes(item):
+    """
+    Two 64-bit hashes of item, identical in every process (unlike
+    hash(), which is salted per interpreter for str/bytes), so sketches
+    built by different workers can be merged.
+    """
+    if isinstance(item, str):
+        data = b"s" + item.encode("utf-8")
+    elif isinstance(item, bytes):
+        data = b"b" + item
+    else:
+        data = type(item).__name__.encode() + b":" + repr(item).encode()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), \
+        int.from_bytes(digest[8:], "little") | 1
+
+
+class CountMinSketch:
+    """
+    Approximate counts of a stream in fixed memory (Count-Min sketch).
+
+    With probability 1 - delta, estimate(item) overestimates the true
+    count by at most epsilon * N (N: total of all counts). Memory is
+    width x depth counters, with width = ceil(e / epsilon) and
+    depth = ceil(ln(1 / delta)), whatever the number of distinct items.
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01):
+        """
+        Args:
+            epsilon (float): Error bound, as a fraction of N.
+            delta (float): Probability of exceeding that bound.
+        """
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("q", bytes(8 * self.width))
+                     for _ in range(self.depth)]
+        self.total = 0
+
+    def _cells(self, item):
+        """Column of item in each row (double hashing: h1 + i * h2)."""
+        h1, h2 = _hashes(item)
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, item, n=1):
+        """Record n occurrences of item."""
+        for row, cell in zip(self.rows, self._cells(item)):
+            row[cell] += n
+        self.total += n
+
+    def update(self, iterable):
+        """Record every item of an iterable."""
+        for item in iterable:
+            self.add(item)
+
+    def estimate(self, item):
+        """Return the estimated count of item (never an underestimate)."""
+        return min(row[cell] for row, cell
+                   in zip(self.rows, self._cells(item)))
+
+    def merge(self, other):
+        """
+        Add another sketch (e.g. from a parallel worker) into this one.
+
+        Raises:
+            ValueError: If the sketches have different dimensions.
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("cannot merge sketches of different sizes")
+        for i, (row, other_row) in enumerate(zip(self.rows, other.rows)):
+            self.rows[i] = array("q", map(int.__add__, row, other_row))
+        self.total += other.total
+
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters of a stream in O(k) memory (Space-Saving).
+
+    At most k items are monitored. An unmonitored item replaces the
+    one with the smallest count and inherits that count as its error,
+    so every count is an overestimate by at most N / k (N: stream
+    length). Any item seen more than N / k times is monitored.
+    """
+
+    def __init__(self, k=None, epsilon=None):
+        """
+        Args:
+            k (int | None): Number of monitored items.
+            epsilon (float | None): Or the error bound as a fraction
+                of N (k = ceil(1 / epsilon)).
+        """
+        if k is None:
+            if epsilon is None:
+                raise ValueError("give k or epsilon")
+            k = math.ceil(1 / epsilon)
+        self.k = k
+        self.counts = {}
+        self.errors = {}
+        self._heap = []  # (count, tie, item), stale entries skipped
+        self._tie = count()
+
+    def add(self, item, n=1):
+        """Record n occurrences of item."""
+        counts = self.counts
+        if item in counts:
+            counts[item] += n
+        elif len(counts) < self.k:
+            counts[item] = n
+            self.errors[item] = 0
+        else:
+            floor, old = self._pop_min()
+            del counts[old], self.errors[old]
+            counts[item] = floor + n
+            self.errors[item] = floor
+        heapq.heappush(self._heap, (counts[item], next(self._tie), item))
+        if len(self._heap) > 4 * self.k:
+            self._rebuild_heap()
+
+    def update(self, iterable):
+        """Record every item of an iterable."""
+        for item in iterable:
+            self.add(item)
+
+    def top(self, n=None):
+        """Return [(item, count, error)], highest counts first."""
+        ranked = sorted(self.counts.items(), key=lambda kv: -kv[1])
+        return [(item, nb, self.errors[item]) for item, nb in ranked[:n]]
+
+    def merge(self, other):
+        """
+        Add another summary (e.g. from a parallel worker) into this one.
+
+        An item missing from a full summary may still have occurred up
+        to that summary's minimum count, which is added to its count and
+        error; the k largest merged counts are kept.
+        """
+        def floor(summary):
+            full = len(summary.counts) >= summary.k
+            return min(summary.counts.values()) if full else 0
+
+        floors = floor(self), floor(other)
+        merged = {}
+        for item in self.counts.keys() | other.counts.keys():
+            nb = err = 0
+            for summary, missing in zip((self, other), floors):
+                nb += summary.counts.get(item, missing)
+                err += summary.errors.get(item, missing)
+            merged[item] = (nb, err)
+        kept = heapq.nlargest(self.k, merged.items(), key=lambda kv: kv[1][0])
+        self.counts = {item: nb for item, (nb, _) in kept}
+        self.errors = {item: err for item, (_, err) in kept}
+        self._rebuild_heap()
+
+    def _pop_min(self):
+        """Return (count, item) of the least counted monitored item."""
+        while True:
+            nb, _, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == nb:
+                return nb, item
+
+    def _rebuild_heap(self):
+        """Drop the stale heap entries."""
+        self._heap = [(nb, next(self._tie), item)
+                      for item, nb in self.counts.items()]
+        heapq.heapify(self._heap)
+
+# Example
+# from ft_package import CountMinSketch, SpaceSaving
+# sketch = CountMinSketch(epsilon=0.001, delta=0.01)
+# sketch.update(["toto", "tata", "toto"])
+# print(sketch.estimate("toto"))  # output: 2 (>= true count)
+# top = SpaceSaving(k=100)
+# top.update(["toto", "tata", "toto"])
+# print(top.top(1))  # output: [('toto', 2, 0)]
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+import heapq
+import json
+import os
+import tempfile
+from collections import Counter
+from itertools import islice
+from operator import countOf, itemgetter
+
+
+def count_in_stream(iterable, item):
+    """
+    Counts how many times `item` appears in any iterable (generator,
+    file, ...), in constant memory, without building a list.
+
+    Args:
+        iterable (iterable): The items to search.
+        item (any): The item to count.
+
+    Returns:
+        int: The number of occurrences of item.
+    """
+    return countOf(iterable, item)
+
+
+class StreamCounter:
+    """
+    Frequency table of a stream too big to hold in memory.
+
+    Items are consumed in chunks of `chunk_size`. When the table holds
+    more than `max_keys` distinct items (the memory budget, roughly
+    100 bytes per key), it is written to disk as a sorted run and
+    emptied. Every `fan_in` runs of the same size are merged into one
+    (so an item is rewritten only log_fan_in(spills) times), and
+    items() merges at most `fan_in` runs at once with heapq.merge:
+    memory and open files stay bounded. Spilled items must be all str
+    (e.g. lines) or all int, the keys that a JSON run gives back
+    unchanged; anything else raises TypeError.
+    """
+
+    def __init__(self, max_keys=None, spill_dir=None, chunk_size=65536,
+                 fan_in=64):
+        """
+        Args:
+            max_keys (int | None): Spill past this many distinct items
+                (None: never spill).
+            spill_dir (str | None): Where to write the runs (default:
+                the system temp dir).
+            chunk_size (int): Number of items counted per chunk.
+            fan_in (int): Most runs merged (and opened) at once.
+        """
+        self.counts = Counter()
+        self.max_keys = max_keys
+        self.spill_dir = spill_dir
+        self.chunk_size = chunk_size
+        self.fan_in = max(fan_in, 2)
+        self.spills = []  # [(level, path)], a level-k run merges fan_in^k
+        self.key_type = None
+
+    def update(self, iterable):
+        """Count every item of an iterable, chunk by chunk."""
+        items = iter(iterable)
+        while True:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return
+            self.counts.update(chunk)
+            if self.max_keys is not None and len(self.counts) > self.max_keys:
+                self._spill()
+
+    def update_file(self, path, encoding="utf-8"):
+        """Count the lines of a text file (without their newline)."""
+        with open(path, encoding=encoding) as f:
+            self.update(line.rstrip("\n") for line in f)
+
+    def count(self, item):
+        """Return the number of occurrences of item so far."""
+        total = self.counts.get(item, 0)
+        for _, path in self.spills:
+            for key, nb in self._read_run(path):
+                if key == item:
+                    total += nb
+                    break
+        return total
+
+    def items(self):
+        """Yield (item, count) pairs; sorted by item if spilled."""
+        if not self.spills:
+            yield from self.counts.items()
+            return
+        self._check_keys()
+        while len(self.spills) >= self.fan_in:  # room for the table
+            self._merge_tail(self.fan_in)
+        runs = [self._read_run(path) for _, path in self.spills]
+        runs.append(sorted(self.counts.items(), key=itemgetter(0)))
+        yield from self._merged(runs)
+
+    def close(self):
+        """Delete the spill files."""
+        for _, path in self.spills:
+            os.remove(path)
+        self.spills = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check_keys(self):
+        """Raise TypeError unless the table keys can be spilled: all str
+        or all int, like the runs already written.
+        """
+        for key in self.counts:
+            key_type = str if isinstance(key, str) \
+                else int if isinstance(key, int) else type(key)
+            if key_type not in (str, int) \
+                    or key_type is not (self.key_type or key_type):
+                raise TypeError("spilled items must be all str or all int,"
+                                f" got {key!r}")
+            self.key_type = key_type
+
+    def _spill(self):
+        """Write the table as a sorted run of JSON lines, then clear it."""
+        self._check_keys()
+        self.spills.append((0, self._write_run(
+            sorted(self.counts.items(), key=itemgetter(0)))))
+        self.counts.clear()
+        # like a counter in base fan_in: fan_in runs of one level carry
+        while len(self.spills) >= self.fan_in \
+                and self.spills[-self.fan_in][0] == self.spills[-1][0]:
+            self._merge_tail(self.fan_in)
+
+    def _merge_tail(self, nb_runs):
+        """Merge the last nb_runs runs into one run of the next level."""
+        tail = self.spills[-nb_runs:]
+        path = self._write_run(self._merged(
+            [self._read_run(run) for _, run in tail]))
+        for _, run in tail:
+            os.remove(run)
+        self.spills[-nb_runs:] = [(max(level for level, _ in tail) + 1,
+                                   path)]
+
+    def _write_run(self, pairs):
+        """Write sorted (item, count) pairs as a JSON-lines run file."""
+        fd, path = tempfile.mkstemp(suffix=".run", dir=self.spill_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for key, nb in pairs:
+                f.write(json.dumps([key, nb]) + "\n")
+        return path
+
+    @staticmethod
+    def _merged(runs):
+        """Merge sorted (item, count) runs, summing equal items."""
+        current, total = None, 0
+        for key, nb in heapq.merge(*runs, key=itemgetter(0)):
+            if total and key != current:
+                yield current, total
+                total = 0
+            current = key
+            total += nb
+        if total:
+            yield current, total
+
+    @staticmethod
+    def _read_run(path):
+        """Yield the (item, count) pairs of one spilled run."""
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                key, nb = json.loads(line)
+                yield key, nb
+
+# Example
+# from ft_package import StreamCounter, count_in_stream
+# print(count_in_stream(open("words.txt"), "toto\n"))
+# with StreamCounter(max_keys=1_000_000) as counter:
+#     counter.update_file("huge_words.txt")
+#     for word, nb in counter.items():
+#         print(word, nb)
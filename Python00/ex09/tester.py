@@ -1,6 +1,33 @@
-from ft_package import count_in_list
+from ft_package import count_in_list, CountIndex, count_many
+from ft_package import count_in_stream, StreamCounter
+from ft_package import CountMinSketch, SpaceSaving
+from ft_package import count_in_list_parallel
 
 if __name__ == '__main__':
     test_list = ["toto", "tata", "toto"]
     print(count_in_list(test_list, "toto"))  # expected: 2
     print(count_in_list(test_list, "tutu"))  # expected: 0
+
+    index = CountIndex(test_list)
+    print(index.count("toto"))  # expected: 2
+    index.remove("toto")
+    index.add("tutu")
+    print(index.count("toto"), index.count("tutu"))  # expected: 1 1
+
+    # expected: {'toto': 2, 'tutu': 0}
+    print(count_many(test_list, ["toto", "tutu"]))
+
+    print(count_in_stream(iter(test_list), "toto"))  # expected: 2
+    with StreamCounter(max_keys=1, chunk_size=1) as counter:
+        counter.update(iter(test_list))
+        print(list(counter.items()))  # expected: [('tata', 1), ('toto', 2)]
+
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    sketch.update(test_list)
+    print(sketch.estimate("toto"))  # expected: 2 (never less)
+    top = SpaceSaving(k=2)
+    top.update(test_list)
+    print(top.top(1))  # expected: [('toto', 2, 0)]
+
+    # a plain list (or a small input) is counted serially
+    print(count_in_list_parallel(test_list, "toto", workers=2))  # expected: 2